@@ -681,7 +681,9 @@ class Discretisation:
         new_var_eqn_dict = {}
         for eqn_key, eqn in var_eqn_dict.items():
             # Broadcast if the equation evaluates to a number (e.g. Scalar)
-            if np.prod(eqn.shape_for_testing) == 1 and not isinstance(eqn_key, str):
+            # Check the key first, so that the shape of the (many) model variables,
+            # which are keyed by name and never broadcast, is not evaluated
+            if not isinstance(eqn_key, str) and np.prod(eqn.shape_for_testing) == 1:
                 if eqn_key.domain == []:
                     eqn = eqn * pybamm.Vector([1])
                 else:
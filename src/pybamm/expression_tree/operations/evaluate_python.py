@@ -4,6 +4,7 @@
 from __future__ import annotations
 import numbers
 from collections import OrderedDict
+from functools import lru_cache
 from numpy.typing import ArrayLike
 
 import numpy as np
@@ -420,6 +421,15 @@ def to_python(
     return constant_values, "\n".join(variable_lines)
 
 
+@lru_cache(maxsize=128)
+def _compile_python_str(python_str: str, result_var: str):
+    """
+    Compile generated python code, reusing the code object when the same source is
+    generated again (e.g. when an unchanged model is set up for solving again)
+    """
+    return compile(python_str, result_var, "exec")
+
+
 class EvaluatorPython:
     """
     Converts a pybamm expression tree into pure python code that will calculate the
@@ -474,7 +484,7 @@ class EvaluatorPython:
         self._symbol = symbol
 
         # compile and run the generated python code,
-        compiled_function = compile(python_str, result_var, "exec")
+        compiled_function = _compile_python_str(python_str, result_var)
         exec(compiled_function)
 
     def __call__(self, t=None, y=None, inputs=None):
@@ -503,7 +513,7 @@ class EvaluatorPython:
         # Execution of bytecode (re)adds attribute
         # "_method"
         self.__dict__.update(state)
-        compiled_function = compile(self._python_str, self._result_var, "exec")
+        compiled_function = _compile_python_str(self._python_str, self._result_var)
         exec(compiled_function)
 
 
@@ -587,7 +597,7 @@ class EvaluatorJax:
         self._python_str = python_str
 
         # compile and run the generated python code,
-        compiled_function = compile(python_str, result_var, "exec")
+        compiled_function = _compile_python_str(python_str, result_var)
         exec(compiled_function)
 
         self._static_argnums = tuple(static_argnums)
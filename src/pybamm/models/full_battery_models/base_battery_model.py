@@ -3,7 +3,7 @@
 #
 
 import pybamm
-from functools import cached_property
+from functools import cached_property, lru_cache
 
 from pybamm.expression_tree.operations.serialise import Serialise
 
@@ -811,6 +811,66 @@ class BatteryModelPhaseOptions(dict):
             return options[self.index]
 
 
+@lru_cache
+def _default_submesh_types(dimensionality):
+    """
+    Default submesh types for a given current collector dimensionality, shared
+    between models. Use :meth:`BaseBatteryModel.default_submesh_types`, which returns
+    a copy that can be safely modified, instead.
+    """
+    base_submeshes = {
+        "negative electrode": pybamm.Uniform1DSubMesh,
+        "separator": pybamm.Uniform1DSubMesh,
+        "positive electrode": pybamm.Uniform1DSubMesh,
+        "negative particle": pybamm.Uniform1DSubMesh,
+        "positive particle": pybamm.Uniform1DSubMesh,
+        "negative primary particle": pybamm.Uniform1DSubMesh,
+        "positive primary particle": pybamm.Uniform1DSubMesh,
+        "negative secondary particle": pybamm.Uniform1DSubMesh,
+        "positive secondary particle": pybamm.Uniform1DSubMesh,
+        "negative particle size": pybamm.Uniform1DSubMesh,
+        "positive particle size": pybamm.Uniform1DSubMesh,
+    }
+    if dimensionality == 0:
+        base_submeshes["current collector"] = pybamm.SubMesh0D
+    elif dimensionality == 1:
+        base_submeshes["current collector"] = pybamm.Uniform1DSubMesh
+    elif dimensionality == 2:
+        base_submeshes["current collector"] = pybamm.ScikitUniform2DSubMesh
+    return base_submeshes
+
+
+@lru_cache
+def _default_spatial_method_types(dimensionality):
+    """
+    Classes of the default spatial methods for a given current collector
+    dimensionality. Spatial methods are built by the discretisation, so
+    :meth:`BaseBatteryModel.default_spatial_methods` creates new instances of these
+    every time it is called.
+    """
+    base_spatial_methods = {
+        "macroscale": pybamm.FiniteVolume,
+        "negative particle": pybamm.FiniteVolume,
+        "positive particle": pybamm.FiniteVolume,
+        "negative primary particle": pybamm.FiniteVolume,
+        "positive primary particle": pybamm.FiniteVolume,
+        "negative secondary particle": pybamm.FiniteVolume,
+        "positive secondary particle": pybamm.FiniteVolume,
+        "negative particle size": pybamm.FiniteVolume,
+        "positive particle size": pybamm.FiniteVolume,
+    }
+    if dimensionality == 0:
+        # 0D submesh - use base spatial method
+        base_spatial_methods["current collector"] = (
+            pybamm.ZeroDimensionalSpatialMethod
+        )
+    elif dimensionality == 1:
+        base_spatial_methods["current collector"] = pybamm.FiniteVolume
+    elif dimensionality == 2:
+        base_spatial_methods["current collector"] = pybamm.ScikitFiniteElement
+    return base_spatial_methods
+
+
 class BaseBatteryModel(pybamm.BaseModel):
     """
     Base model class with some default settings and required variables
@@ -867,57 +927,22 @@ class BaseBatteryModel(pybamm.BaseModel):
             "R_p": 30,
         }
         # Reduce the default points for 2D current collectors
-        if self.options["dimensionality"] == 2:
+        if self._dimensionality == 2:
             base_var_pts.update({"x_n": 10, "x_s": 10, "x_p": 10})
         return base_var_pts
 
     @property
     def default_submesh_types(self):
-        base_submeshes = {
-            "negative electrode": pybamm.Uniform1DSubMesh,
-            "separator": pybamm.Uniform1DSubMesh,
-            "positive electrode": pybamm.Uniform1DSubMesh,
-            "negative particle": pybamm.Uniform1DSubMesh,
-            "positive particle": pybamm.Uniform1DSubMesh,
-            "negative primary particle": pybamm.Uniform1DSubMesh,
-            "positive primary particle": pybamm.Uniform1DSubMesh,
-            "negative secondary particle": pybamm.Uniform1DSubMesh,
-            "positive secondary particle": pybamm.Uniform1DSubMesh,
-            "negative particle size": pybamm.Uniform1DSubMesh,
-            "positive particle size": pybamm.Uniform1DSubMesh,
-        }
-        if self.options["dimensionality"] == 0:
-            base_submeshes["current collector"] = pybamm.SubMesh0D
-        elif self.options["dimensionality"] == 1:
-            base_submeshes["current collector"] = pybamm.Uniform1DSubMesh
-
-        elif self.options["dimensionality"] == 2:
-            base_submeshes["current collector"] = pybamm.ScikitUniform2DSubMesh
-        return base_submeshes
+        return _default_submesh_types(self._dimensionality).copy()
 
     @property
     def default_spatial_methods(self):
-        base_spatial_methods = {
-            "macroscale": pybamm.FiniteVolume(),
-            "negative particle": pybamm.FiniteVolume(),
-            "positive particle": pybamm.FiniteVolume(),
-            "negative primary particle": pybamm.FiniteVolume(),
-            "positive primary particle": pybamm.FiniteVolume(),
-            "negative secondary particle": pybamm.FiniteVolume(),
-            "positive secondary particle": pybamm.FiniteVolume(),
-            "negative particle size": pybamm.FiniteVolume(),
-            "positive particle size": pybamm.FiniteVolume(),
+        return {
+            domain: spatial_method()
+            for domain, spatial_method in _default_spatial_method_types(
+                self._dimensionality
+            ).items()
         }
-        if self.options["dimensionality"] == 0:
-            # 0D submesh - use base spatial method
-            base_spatial_methods["current collector"] = (
-                pybamm.ZeroDimensionalSpatialMethod()
-            )
-        elif self.options["dimensionality"] == 1:
-            base_spatial_methods["current collector"] = pybamm.FiniteVolume()
-        elif self.options["dimensionality"] == 2:
-            base_spatial_methods["current collector"] = pybamm.ScikitFiniteElement()
-        return base_spatial_methods
 
     @property
     def options(self):
@@ -991,26 +1016,30 @@ class BaseBatteryModel(pybamm.BaseModel):
             )
 
         self._options = options
+        # Cache the dimensionality, which is looked up whenever the default geometry,
+        # meshes and spatial methods are accessed
+        self._dimensionality = options["dimensionality"]
 
     def set_standard_output_variables(self):
-        # Time
-        self.variables.update(
-            {
-                "Time [s]": pybamm.t,
-                "Time [min]": pybamm.t / 60,
-                "Time [h]": pybamm.t / 3600,
-            }
-        )
-
-        # Spatial
+        # Collect the standard output variables and add them to the model in a
+        # single update
         var = pybamm.standard_spatial_vars
-        self.variables.update(
-            {"x [m]": var.x, "x_n [m]": var.x_n, "x_s [m]": var.x_s, "x_p [m]": var.x_p}
-        )
-        if self.options["dimensionality"] == 1:
-            self.variables.update({"z [m]": var.z})
-        elif self.options["dimensionality"] == 2:
-            self.variables.update({"y [m]": var.y, "z [m]": var.z})
+        variables = {
+            # Time
+            "Time [s]": pybamm.t,
+            "Time [min]": pybamm.t / 60,
+            "Time [h]": pybamm.t / 3600,
+            # Spatial
+            "x [m]": var.x,
+            "x_n [m]": var.x_n,
+            "x_s [m]": var.x_s,
+            "x_p [m]": var.x_p,
+        }
+        if self._dimensionality == 1:
+            variables["z [m]"] = var.z
+        elif self._dimensionality == 2:
+            variables.update({"y [m]": var.y, "z [m]": var.z})
+        self.variables.update(variables)
 
     def build_model_equations(self):
         # Set model equations
@@ -1252,14 +1281,9 @@ class BaseBatteryModel(pybamm.BaseModel):
         elif self.options["thermal"] == "lumped":
             thermal_submodel = pybamm.thermal.Lumped
         elif self.options["thermal"] == "x-lumped":
-            if self.options["dimensionality"] == 0:
-                thermal_submodel = pybamm.thermal.Lumped
-            elif self.options["dimensionality"] == 1:
-                thermal_submodel = pybamm.thermal.pouch_cell.CurrentCollector1D
-            elif self.options["dimensionality"] == 2:
-                thermal_submodel = pybamm.thermal.pouch_cell.CurrentCollector2D
+            thermal_submodel = self._x_lumped_thermal_submodels[self._dimensionality]
         elif self.options["thermal"] == "x-full":
-            if self.options["dimensionality"] == 0:
+            if self._dimensionality == 0:
                 thermal_submodel = pybamm.thermal.pouch_cell.OneDimensionalX
 
         x_average = getattr(self, "x_average", False)
@@ -1278,12 +1302,34 @@ class BaseBatteryModel(pybamm.BaseModel):
         if self.options["current collector"] in ["uniform"]:
             submodel = pybamm.current_collector.Uniform(self.param)
         elif self.options["current collector"] == "potential pair":
-            if self.options["dimensionality"] == 1:
-                submodel = pybamm.current_collector.PotentialPair1plus1D(self.param)
-            elif self.options["dimensionality"] == 2:
-                submodel = pybamm.current_collector.PotentialPair2plus1D(self.param)
+            submodel = self._potential_pair_submodels[self._dimensionality](self.param)
         self.submodels["current collector"] = submodel
 
+    @property
+    def _x_lumped_thermal_submodels(self):
+        """
+        Thermal submodel classes for the "x-lumped" thermal option, keyed on the
+        current collector dimensionality. Subclasses can override this to change the
+        submodel for a single dimensionality.
+        """
+        return {
+            0: pybamm.thermal.Lumped,
+            1: pybamm.thermal.pouch_cell.CurrentCollector1D,
+            2: pybamm.thermal.pouch_cell.CurrentCollector2D,
+        }
+
+    @property
+    def _potential_pair_submodels(self):
+        """
+        Current collector submodel classes for the "potential pair" current collector
+        option, keyed on the current collector dimensionality. Subclasses can override
+        this to change the submodel for a single dimensionality.
+        """
+        return {
+            1: pybamm.current_collector.PotentialPair1plus1D,
+            2: pybamm.current_collector.PotentialPair2plus1D,
+        }
+
     def set_interface_utilisation_submodel(self):
         for domain in ["negative", "positive"]:
             Domain = domain.capitalize()
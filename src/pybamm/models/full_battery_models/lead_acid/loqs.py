@@ -37,7 +37,7 @@ class LOQS(BaseModel):
         if build:
             self.build_model()
 
-        if self.options["dimensionality"] == 0:
+        if self._dimensionality == 0:
             self.use_jacobian = False
 
         pybamm.citations.register("Sulzer2019asymptotic")
@@ -73,10 +73,7 @@ class LOQS(BaseModel):
         ]:
             submodel = pybamm.current_collector.Uniform(self.param)
         elif self.options["current collector"] == "potential pair":
-            if self.options["dimensionality"] == 1:
-                submodel = pybamm.current_collector.PotentialPair1plus1D(self.param)
-            elif self.options["dimensionality"] == 2:
-                submodel = pybamm.current_collector.PotentialPair2plus1D(self.param)
+            submodel = self._potential_pair_submodels[self._dimensionality](self.param)
         self.submodels["leading-order current collector"] = submodel
 
     def set_porosity_submodel(self):
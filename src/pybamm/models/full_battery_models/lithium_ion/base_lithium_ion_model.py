@@ -495,7 +495,7 @@ class BaseModel(pybamm.BaseBatteryModel):
             The position in space at which to measure the electrolyte potential. If
             None, defaults to the mid-point of the separator.
         """
-        if self.options["dimensionality"] != 0:
+        if self._dimensionality != 0:
             raise NotImplementedError(
                 "Reference electrode can only be inserted for models where "
                 "'dimensionality' is 0. For other models, please add a reference "
@@ -1,5 +1,13 @@
 import pybamm
 
+# Allowed submodel domains, mapped to their capitalised form
+_CAPITALISED_DOMAINS = {
+    "negative": "Negative",
+    "separator": "Separator",
+    "positive": "Positive",
+    None: None,
+}
+
 
 class BaseSubModel(pybamm.BaseModel):
     """
@@ -114,15 +122,16 @@ class BaseSubModel(pybamm.BaseModel):
     def domain(self, domain):
         if domain is not None:
             domain = domain.lower()
-        ok_domain_list = ["negative", "separator", "positive", None]
-        if domain in ok_domain_list:
-            self._domain = domain
-            if domain is not None:
-                self._Domain = domain.capitalize()
-        else:
+        try:
+            Domain = _CAPITALISED_DOMAINS[domain]
+        except KeyError as error:
             raise pybamm.DomainError(
-                f"Domain '{domain}' not recognised (must be one of {ok_domain_list})"
-            )
+                f"Domain '{domain}' not recognised "
+                f"(must be one of {list(_CAPITALISED_DOMAINS)})"
+            ) from error
+        self._domain = domain
+        if Domain is not None:
+            self._Domain = Domain
 
     @property
     def domain_Domain(self):
@@ -6,7 +6,6 @@ import casadi
 import numpy as np
 import pybamm
 from scipy.integrate import cumulative_trapezoid
-import xarray as xr
 import bisect
 
 
@@ -321,6 +320,8 @@ class ProcessedVariable:
         Evaluate the variable at arbitrary *dimensional* t (and x, r, y, z and/or R),
         using interpolation
         """
+        import xarray as xr
+
         if observe_raw:
             if not self.xr_array_raw_initialized:
                 self._xr_array_raw = xr.DataArray(entries_for_interp, coords=coords)
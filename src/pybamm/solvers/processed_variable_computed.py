@@ -5,7 +5,6 @@ import casadi
 import numpy as np
 import pybamm
 from scipy.integrate import cumulative_trapezoid
-import xarray as xr
 
 
 class ProcessedVariableComputed:
@@ -198,6 +197,8 @@ class ProcessedVariableComputed:
             )
 
         # set up interpolation
+        import xarray as xr
+
         self._xr_data_array = xr.DataArray(entries, coords=[("t", self.t_pts)])
 
         self.entries = entries
@@ -255,6 +256,8 @@ class ProcessedVariableComputed:
         self.first_dim_pts = edges
 
         # set up interpolation
+        import xarray as xr
+
         self._xr_data_array = xr.DataArray(
             entries_for_interp,
             coords=[(self.first_dimension, pts_for_interp), ("t", self.t_pts)],
@@ -385,6 +388,8 @@ class ProcessedVariableComputed:
         self.second_dim_pts = second_dim_edges
 
         # set up interpolation
+        import xarray as xr
+
         self._xr_data_array = xr.DataArray(
             entries_for_interp,
             coords={
@@ -417,6 +422,8 @@ class ProcessedVariableComputed:
         self.second_dim_pts = z_sol
 
         # set up interpolation
+        import xarray as xr
+
         self._xr_data_array = xr.DataArray(
             entries,
             coords={"y": y_sol, "z": z_sol, "t": self.t_pts},
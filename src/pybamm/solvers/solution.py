@@ -8,7 +8,6 @@ import numbers
 import numpy as np
 import pickle
 import pybamm
-import pandas as pd
 from scipy.io import savemat
 from functools import cached_property
 
@@ -853,6 +852,8 @@ class Solution:
                     raise ValueError(
                         f"only 0D variables can be saved to csv, but '{name}' is {var.ndim - 1}D"
                     )
+            import pandas as pd
+
             df = pd.DataFrame(data)
             return df.to_csv(filename, index=False)
         elif to_format == "json":
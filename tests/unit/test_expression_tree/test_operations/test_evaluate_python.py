@@ -4,6 +4,7 @@
 
 import pytest
 import pybamm
+from pybamm.expression_tree.operations import evaluate_python
 
 from tests import get_discretisation_for_testing, get_1p1d_discretisation_for_testing
 import numpy as np
@@ -445,6 +446,18 @@ class TestEvaluate:
             result = evaluator(t=t, y=y)
             np.testing.assert_allclose(result, expr.evaluate(t=t, y=y))
 
+    def test_evaluator_python_reuses_compiled_code(self):
+        a = pybamm.StateVector(slice(0, 1))
+        b = pybamm.StateVector(slice(1, 2))
+        expr = a * b
+        compile_python_str = evaluate_python._compile_python_str
+        pybamm.EvaluatorPython(expr)
+        hits = compile_python_str.cache_info().hits
+        # generating the same code again reuses the compiled code object
+        evaluator = pybamm.EvaluatorPython(expr)
+        assert compile_python_str.cache_info().hits == hits + 1
+        assert evaluator(t=None, y=np.array([[2], [3]])) == 6
+
     @pytest.mark.skipif(not pybamm.has_jax(), reason="jax or jaxlib is not installed")
     def test_find_symbols_jax(self):
         # test sparse conversion
@@ -125,6 +125,14 @@ class TestBaseBatteryModel:
             pybamm.ScikitUniform2DSubMesh,
         )
 
+        # modifying the returned submesh types does not change the defaults
+        submesh_types = model.default_submesh_types
+        submesh_types["current collector"] = pybamm.SubMesh0D
+        assert issubclass(
+            model.default_submesh_types["current collector"],
+            pybamm.ScikitUniform2DSubMesh,
+        )
+
     def test_default_var_pts(self):
         var_pts = {
             "x_n": 20,
@@ -148,6 +156,11 @@ class TestBaseBatteryModel:
         model = pybamm.BaseBatteryModel({"dimensionality": 2})
         assert var_pts == model.default_var_pts
 
+        # the cached dimensionality is updated when the options are set
+        model = pybamm.BaseBatteryModel({"dimensionality": 0})
+        model.options = {"dimensionality": 2}
+        assert var_pts == model.default_var_pts
+
     def test_default_spatial_methods(self):
         model = pybamm.BaseBatteryModel({"dimensionality": 0})
         assert isinstance(
@@ -163,6 +176,11 @@ class TestBaseBatteryModel:
             model.default_spatial_methods["current collector"],
             pybamm.ScikitFiniteElement,
         )
+        # spatial methods are new instances every time
+        assert (
+            model.default_spatial_methods["current collector"]
+            is not model.default_spatial_methods["current collector"]
+        )
 
     def test_options(self):
         with pytest.raises(pybamm.OptionError, match="Option"):
@@ -10,6 +10,9 @@ class TestBaseSubModel:
         # Accepted string
         submodel = pybamm.BaseSubModel(None, "negative", phase="primary")
         assert submodel.domain == "negative"
+        assert submodel.domain_Domain == ("negative", "Negative")
+        submodel = pybamm.BaseSubModel(None, "Positive", phase="primary")
+        assert submodel.domain_Domain == ("positive", "Positive")
 
         # None
         submodel = pybamm.BaseSubModel(None, None)
@@ -1,6 +1,7 @@
 import pytest
 import importlib
 import os
+import subprocess  # nosec
 import sys
 import pybamm
 import tempfile
@@ -153,6 +154,18 @@ class TestUtil:
             for module_name, module in modules.items():
                 sys.modules[module_name] = module
 
+    def test_pybamm_import_is_lazy(self):
+        # xarray and pandas are slow to import and only needed for interpolating
+        # processed variables and saving solutions, so they are imported on first use
+        code = (
+            "import sys, pybamm; "
+            "print(sorted({'xarray', 'pandas'} & set(sys.modules)))"
+        )
+        result = subprocess.run(  # nosec
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
     def test_optional_dependencies(self):
         optional_distribution_deps = get_optional_distribution_deps("pybamm")
         required_distribution_deps = get_required_distribution_deps("pybamm")